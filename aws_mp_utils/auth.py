@@ -23,6 +23,8 @@
 
 import boto3
 
+from botocore.config import Config
+
 from aws_mp_utils.exceptions import AWSMPUtilsException
 
 
@@ -53,12 +55,14 @@ def get_session(
 def get_client(
     service_name: str,
     region_name: str,
-    session: boto3.Session
+    session: boto3.Session,
+    config: Config = None
 ) -> boto3.client:
     """
     Return client for the given session and service.
     """
     return session.client(
         service_name=service_name,
-        region_name=region_name
+        region_name=region_name,
+        config=config
     )
@@ -21,17 +21,26 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import random
 import re
 import time
 
-import boto3
-import botocore.exceptions as boto_exceptions
+from typing import TYPE_CHECKING
 
 from aws_mp_utils.exceptions import AWSMPUtilsException
 
+if TYPE_CHECKING:
+    import boto3
+
+_RE_CHANGE_ID = re.compile(r'change sets: (?P<id>\w{25})')
+
+# Final change set statuses, these never change once reached
+TERMINAL_STATUSES = ('succeeded', 'cancelled', 'failed')
+_status_cache = {}
+
 
 def get_change_set(
-    client: boto3.client,
+    client: 'boto3.client',
     change_set_id: str,
     catalog: str = 'AWSMarketplace'
 ) -> dict:
@@ -47,11 +56,19 @@ def get_change_set(
 
 
 def get_change_set_status(
-    client: boto3.client,
+    client: 'boto3.client',
     change_set_id: str,
     catalog: str = 'AWSMarketplace'
 ) -> str:
-    """Gets the status of the changeset"""
+    """
+    Gets the status of the changeset
+
+    Terminal statuses are cached as they can no longer change.
+    """
+    cache_key = (catalog, change_set_id)
+    if cache_key in _status_cache:
+        return _status_cache[cache_key]
+
     response = get_change_set(
         client,
         change_set_id,
@@ -60,11 +77,25 @@ def get_change_set_status(
     if response and 'Status' in response:
         # 'Status':'PREPARING'|'APPLYING'|'SUCCEEDED'|'CANCELLED'|'FAILED'
         status = response['Status'].lower()
+        if status in TERMINAL_STATUSES:
+            _status_cache[cache_key] = status
         return status
 
 
+def _backoff(
+    attempt: int,
+    base: int = 2,
+    cap: int = 1800
+) -> float:
+    """
+    Returns a jittered exponential backoff delay (in seconds)
+    for the given attempt, bounded by cap.
+    """
+    return random.uniform(min(base, cap), min(cap, base * 3 ** attempt))
+
+
 def start_mp_change_set(
-    client: boto3.client,
+    client: 'boto3.client',
     change_set: list,
     max_rechecks: int = 10,
     conflict_wait_period: int = 1800,
@@ -76,13 +107,18 @@ def start_mp_change_set(
     performed when a marketplace change cannot be applied because some resource
     is affected by some other ongoing change (and ResourceInUseException is
     raised by boto3).
-    - conflict_wait_period is the period (in seconds) that is waited
-    between checks for the ongoing mp change to be finished (defaults to 900s).
+    - conflict_wait_period is the maximum period (in seconds) that is waited
+    for the ongoing mp change to be finished before the change set is
+    resubmitted (defaults to 1800s). The ongoing change is polled with a
+    short jittered backoff and the change set is resubmitted as soon as
+    the ongoing change is finished. If the ongoing change cannot be
+    identified or polled, or is already finished, the resubmission is
+    delayed by a jittered backoff bounded by conflict_wait_period.
     """
-    retries = 3
-    while retries > 0:
-        conflicting_changeset = False
-        conflicting_error_message = ''
+    import botocore.exceptions as boto_exceptions
+
+    attempt = 0
+    while True:
         try:
             response = client.start_change_set(
                 Catalog=catalog,
@@ -91,44 +127,88 @@ def start_mp_change_set(
             return response
 
         except boto_exceptions.ClientError as error:
-            if error.response['Error']['Code'] == 'ResourceInUseException':
-                # Conflicting changeset for some resource
-                conflicting_changeset = True
-                conflicting_error_message = str(error)
-            else:
+            if error.response['Error']['Code'] != 'ResourceInUseException':
                 raise
+            # Conflicting changeset for some resource
+            conflicting_error_message = str(error)
 
-        if conflicting_changeset:
-            conflicting_changeset = False
-            time.sleep(conflict_wait_period)
-            max_rechecks -= 1
-            if max_rechecks <= 0:
-                try:
-                    ongoing_change_id = get_ongoing_change_id_from_error(
-                        conflicting_error_message
-                    )
-                    raise AWSMPUtilsException(
-                        'Unable to complete successfully the mp change.'
-                        f' Timed out waiting for {ongoing_change_id}'
-                        ' to finish.'
-                    )
-                except Exception:
-                    raise
+        max_rechecks -= 1
+        if max_rechecks <= 0:
+            ongoing_change_id = get_ongoing_change_id_from_error(
+                conflicting_error_message
+            )
+            raise AWSMPUtilsException(
+                'Unable to complete successfully the mp change.'
+                f' Timed out waiting for {ongoing_change_id}'
+                ' to finish.'
+            )
+
+        try:
+            ongoing_change_id = get_ongoing_change_id_from_error(
+                conflicting_error_message
+            )
+        except AWSMPUtilsException:
+            # Unknown ongoing change
+            pass
         else:
-            retries -= 1
+            try:
+                status = get_change_set_status(
+                    client,
+                    ongoing_change_id,
+                    catalog
+                )
+                if status not in TERMINAL_STATUSES:
+                    wait_for_change_set(
+                        client,
+                        ongoing_change_id,
+                        conflict_wait_period,
+                        catalog
+                    )
+                    continue
+            except boto_exceptions.ClientError:
+                # Ongoing change status cannot be polled
+                pass
 
-    raise AWSMPUtilsException(
-        'Unable to complete successfully the mp change.'
-    )
+        # The ongoing change is unknown, cannot be polled or is already
+        # finished while the resource is still reported in use, back off
+        # before resubmitting
+        time.sleep(_backoff(attempt, cap=conflict_wait_period))
+        attempt += 1
+
+
+def wait_for_change_set(
+    client: 'boto3.client',
+    change_set_id: str,
+    timeout: int,
+    catalog: str = 'AWSMarketplace'
+) -> bool:
+    """
+    Polls the change set status until it is finished or the
+    timeout (in seconds) expires.
+
+    Returns True if the change set finished within the timeout.
+    """
+    deadline = time.monotonic() + timeout
+    attempt = 0
+
+    while True:
+        status = get_change_set_status(client, change_set_id, catalog)
+        if status in TERMINAL_STATUSES:
+            return True
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+
+        time.sleep(min(remaining, _backoff(attempt, base=5, cap=60)))
+        attempt += 1
 
 
 def get_ongoing_change_id_from_error(message: str) -> str:
-    re_change_id = r'change sets: (\w{25})'
-    match = re.search(re_change_id, message)
+    match = _RE_CHANGE_ID.search(message)
 
     if match:
-        change_id = match.group(1)
-        return change_id
+        return match.group('id')
     else:
         raise AWSMPUtilsException(
             f'Unable to extract changeset id from aws err response: {message}'
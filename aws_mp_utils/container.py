@@ -23,12 +23,22 @@
 
 import json
 
-import boto3
+from typing import TYPE_CHECKING
+
 import jmespath
 
+if TYPE_CHECKING:
+    import boto3
+
+_CONTAINER_PRODUCT_TYPE = 'ContainerProduct@1.0'
+
+_HELM_VERSIONS_EXPR = jmespath.compile(
+    'Versions[].{title: VersionTitle, delivery_options: DeliveryOptions}'
+)
+
 
 def get_helm_delivery_option_id(
-    client: boto3.client,
+    client: 'boto3.client',
     entity_id: str,
     version_title: str,
     catalog: str = 'AWSMarketplace'
@@ -60,13 +70,53 @@ def get_helm_delivery_option_id(
         EntityId=entity_id
     )
     details = entity['DetailsDocument']
+    versions = _HELM_VERSIONS_EXPR.search(details) or []
 
-    result = jmespath.search(
-        f"Versions[?VersionTitle=='{version_title}'] | [0]"
-        ".DeliveryOptions[?Type=='Helm'] | [0].Id",
-        details
-    )
-    return result
+    for version in versions:
+        if version['title'] == version_title:
+            return next(
+                (
+                    option.get('Id')
+                    for option in version['delivery_options'] or []
+                    if option.get('Type') == 'Helm'
+                ),
+                None
+            )
+
+    return None
+
+
+def _build_helm_changeset(
+    change_type: str,
+    entity_id: str,
+    version: dict,
+    delivery_option: dict,
+    helm_details: dict
+) -> dict:
+    """
+    Builds a container product changeset for the given change type.
+    The delivery option is only included if there are helm details.
+    """
+    data = {
+        'ChangeType': change_type,
+        'Entity': {
+            'Type': _CONTAINER_PRODUCT_TYPE,
+            'Identifier': entity_id
+        }
+    }
+    details = {}
+
+    if version:
+        details['Version'] = version
+
+    if helm_details:
+        details['DeliveryOptions'] = [{
+            **delivery_option,
+            'Details': {'HelmDeliveryOptionDetails': helm_details}
+        }]
+
+    data['Details'] = json.dumps(details)
+    return data
 
 
 def gen_add_delivery_options_changeset(
@@ -90,42 +140,27 @@ def gen_add_delivery_options_changeset(
     https://docs.aws.amazon.com/marketplace-catalog/latest/api-reference/
     container-products.html#working-with-container-products
     """
-
-    data = {
-        'ChangeType': 'AddDeliveryOptions',
-        'Entity': {
-            'Type': 'ContainerProduct@1.0',
-            'Identifier': entity_id
-        }
-    }
-
-    details = {
-        'Version': {
+    return _build_helm_changeset(
+        'AddDeliveryOptions',
+        entity_id,
+        {
             'VersionTitle': version_title,
             'ReleaseNotes': release_notes
         },
-        'DeliveryOptions': [{
-            'DeliveryOptionTitle': delivery_option_title,
-            'Details': {
-                'HelmDeliveryOptionDetails': {
-                    'CompatibleServices': compatible_services,
-                    'ContainerImages': container_images,
-                    'HelmChartUri': helm_chart_uri,
-                    'Description': helm_chart_description,
-                    'UsageInstructions': usage_instructions,
-                    'QuickLaunchEnabled': quick_launch_enabled,
-                    'MarketplaceServiceAccountName':
-                        marketplace_service_account_name,
-                    'ReleaseName': release_name,
-                    'Namespace': namespace,
-                    'OverrideParameters': override_parameters
-                }
-            }
-        }]
-    }
-
-    data['Details'] = json.dumps(details)
-    return data
+        {'DeliveryOptionTitle': delivery_option_title},
+        {
+            'CompatibleServices': compatible_services,
+            'ContainerImages': container_images,
+            'HelmChartUri': helm_chart_uri,
+            'Description': helm_chart_description,
+            'UsageInstructions': usage_instructions,
+            'QuickLaunchEnabled': quick_launch_enabled,
+            'MarketplaceServiceAccountName': marketplace_service_account_name,
+            'ReleaseName': release_name,
+            'Namespace': namespace,
+            'OverrideParameters': override_parameters
+        }
+    )
 
 
 def gen_update_delivery_options_changeset(
@@ -149,72 +184,35 @@ def gen_update_delivery_options_changeset(
     Function to generate a marketplace changeset of UpdateDeliveryOptions
     type https://docs.aws.amazon.com/marketplace-catalog/latest/
     api-reference/container-products.html#working-with-container-products
-    """
 
-    data = {
-        'ChangeType': 'UpdateDeliveryOptions',
-        'Entity': {
-            'Type': 'ContainerProduct@1.0',
-            'Identifier': entity_id
-        }
+    Only the values provided are included in the changeset.
+    """
+    version = {
+        'VersionTitle': version_title,
+        'ReleaseNotes': release_notes
+    }
+    helm_details = {
+        'DeliveryOptionTitle': delivery_option_title,
+        'CompatibleServices': compatible_services,
+        'ContainerImages': container_images,
+        'HelmChartUri': helm_chart_uri,
+        'Description': helm_chart_description,
+        'UsageInstructions': usage_instructions,
+        'QuickLaunchEnabled': quick_launch_enabled,
+        'MarketplaceServiceAccountName': marketplace_service_account_name,
+        'ReleaseName': release_name,
+        'Namespace': namespace,
+        'OverrideParameters': override_parameters
     }
 
-    version = {}
-    helm_details = {}
-    details = {}
-
-    if version_title:
-        version['VersionTitle'] = version_title
-
-    if release_notes:
-        version['ReleaseNotes'] = release_notes
-
-    if version:
-        details['Version'] = version
-
-    if delivery_option_title:
-        helm_details['DeliveryOptionTitle'] = delivery_option_title
-
-    if compatible_services:
-        helm_details['CompatibleServices'] = compatible_services
-
-    if container_images:
-        helm_details['ContainerImages'] = container_images
-
-    if helm_chart_uri:
-        helm_details['HelmChartUri'] = helm_chart_uri
-
-    if helm_chart_description:
-        helm_details['Description'] = helm_chart_description
-
-    if usage_instructions:
-        helm_details['UsageInstructions'] = usage_instructions
-
-    if quick_launch_enabled is not None:
-        helm_details['QuickLaunchEnabled'] = quick_launch_enabled
-
-    if marketplace_service_account_name:
-        helm_details['MarketplaceServiceAccountName'] = \
-            marketplace_service_account_name
-
-    if release_name:
-        helm_details['ReleaseName'] = release_name
-
-    if namespace:
-        helm_details['Namespace'] = namespace
-
-    if override_parameters:
-        helm_details['OverrideParameters'] = override_parameters
-
-    if helm_details:
-        details['DeliveryOptions'] = [
-            {
-                'Id': delivery_option_id,
-                'Details': {
-                    'HelmDeliveryOptionDetails': helm_details
-                }
-            }
-        ]
-
-    data['Details'] = json.dumps(details)
-    return data
+    return _build_helm_changeset(
+        'UpdateDeliveryOptions',
+        entity_id,
+        {key: value for key, value in version.items() if value},
+        {'Id': delivery_option_id},
+        {
+            key: value for key, value in helm_details.items()
+            # QuickLaunchEnabled can be explicitly disabled
+            if value or (key == 'QuickLaunchEnabled' and value is not None)
+        }
+    )
@@ -23,9 +23,29 @@
 
 import json
 
-import boto3
+from typing import TYPE_CHECKING
+
 import jmespath
 
+if TYPE_CHECKING:
+    import boto3
+
+_AMI_PRODUCT_TYPE = 'AmiProduct@1.0'
+
+_IMAGE_VERSIONS_EXPR = jmespath.compile(
+    'Versions[].{sources: Sources, delivery_options: DeliveryOptions}'
+)
+
+# SSH from anywhere, used when no ingress rules are provided
+_DEFAULT_INGRESS_RULES = (
+    {
+        'FromPort': 22,
+        'IpProtocol': 'tcp',
+        'IpRanges': ('0.0.0.0/0',),
+        'ToPort': 22
+    },
+)
+
 
 def create_restrict_version_change_doc(
     entity_id: str,
@@ -39,7 +59,7 @@ def create_restrict_version_change_doc(
     data = {
         'ChangeType': 'RestrictDeliveryOptions',
         'Entity': {
-            'Type': 'AmiProduct@1.0',
+            'Type': _AMI_PRODUCT_TYPE,
             'Identifier': entity_id
         }
     }
@@ -65,17 +85,12 @@ def create_add_version_change_doc(
     ingress_rules: list = None,
 ) -> dict:
     if not ingress_rules:
-        ingress_rules = [{
-            'FromPort': 22,
-            'IpProtocol': 'tcp',
-            'IpRanges': ['0.0.0.0/0'],
-            'ToPort': 22
-        }]
+        ingress_rules = list(_DEFAULT_INGRESS_RULES)
 
     data = {
         'ChangeType': 'AddDeliveryOptions',
         'Entity': {
-            'Type': 'AmiProduct@1.0',
+            'Type': _AMI_PRODUCT_TYPE,
             'Identifier': entity_id
         }
     }
@@ -108,7 +123,7 @@ def create_add_version_change_doc(
 
 
 def get_image_delivery_option_id(
-    client: boto3.client,
+    client: 'boto3.client',
     entity_id: str,
     ami_id: str,
     catalog: str = 'AWSMarketplace'
@@ -145,26 +160,26 @@ def get_image_delivery_option_id(
     }
     """
     details = entity['DetailsDocument']
+    versions = _IMAGE_VERSIONS_EXPR.search(details) or []
 
-    source_id = jmespath.search(
-        f"Versions[?Sources[?Image=='{ami_id}']] | [0].Sources | [0].Id",
-        details
-    )
-
-    if not source_id:
-        return None
-
-    delivery_option_id = jmespath.search(
-        f"Versions[?DeliveryOptions[?SourceId=='{source_id}']] | "
-        "[0].DeliveryOptions | [0].Id",
-        details
-    )
+    for version in versions:
+        for source in version['sources'] or []:
+            if source.get('Image') == ami_id:
+                source_id = source.get('Id')
+                return next(
+                    (
+                        option.get('Id')
+                        for option in version['delivery_options'] or []
+                        if option.get('SourceId') == source_id
+                    ),
+                    None
+                )
 
-    return delivery_option_id
+    return None
 
 
 def get_images_details(
-    client: boto3.client,
+    client: 'boto3.client',
     ami_ids: list[str]
 ) -> dict:
     """
@@ -22,9 +22,13 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import json
-import boto3
 import jmespath
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import boto3
+
 
 def create_update_offer_change_doc(
     offer_id: str,
@@ -66,7 +70,7 @@ def create_update_offer_change_doc(
 
 
 def get_ami_ids_in_mp_entity(
-    client: boto3.client,
+    client: 'boto3.client',
     entity_id: str,
     visibility_filter: str = 'Public',
     catalog: str = 'AWSMarketplace'
@@ -19,12 +19,16 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import boto3
 import jmespath
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import boto3
+
 
 def get_available_instance_types(
-    client: boto3.client,
+    client: 'boto3.client',
     offer_id: str,
     catalog: str = 'AWSMarketplace'
 ) -> list[str]:
@@ -34,10 +34,9 @@ from aws_mp_utils.scripts.container import container
 from aws_mp_utils.scripts.image import image
 from aws_mp_utils.scripts.offer import offer
 from aws_mp_utils.scripts.cli_utils import (
-    add_options,
+    add_shared_options,
     get_config,
     process_shared_options,
-    shared_options,
     echo_style,
     get_mp_client,
     handle_errors
@@ -91,7 +90,7 @@ def main(context):
     default='AWSMarketplace',
     help='The catalog related to the request.'
 )
-@add_options(shared_options)
+@add_shared_options
 @click.pass_context
 def describe_change_set(
     context,
@@ -116,6 +115,7 @@ def describe_change_set(
         change_set = get_change_set(client, change_set_id, catalog)
 
     echo_style(json.dumps(change_set), config_data.no_color, fg='green')
+    return change_set
 
 
 # -----------------------------------------------------------------------------
@@ -132,7 +132,7 @@ def describe_change_set(
     default='AWSMarketplace',
     help='The catalog related to the request.'
 )
-@add_options(shared_options)
+@add_shared_options
 @click.pass_context
 def describe_change_set_status(
     context,
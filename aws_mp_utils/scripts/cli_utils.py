@@ -3,12 +3,10 @@ import os
 import sys
 
 import click
-import yaml
 
-from collections import ChainMap, namedtuple
+from collections import namedtuple
 from contextlib import contextmanager
-
-from aws_mp_utils.auth import get_client, get_session
+from functools import lru_cache
 
 
 default_config_file = os.path.expanduser('~/.config/aws_mp_utils/default.yaml')
@@ -22,11 +20,32 @@ config_defaults = {
     'region': 'us-east-1'
 }
 
+mp_client_config = {
+    'retries': {
+        'max_attempts': 10,
+        'mode': 'adaptive'
+    },
+    'connect_timeout': 5,
+    'read_timeout': 30,
+    'max_pool_connections': 32,
+    'tcp_keepalive': True
+}
+
 aws_mp_utils_config = namedtuple(
     'aws_mp_utils_config',
     sorted(config_defaults)
 )
 
+_config_cache = {}
+
+shared_option_keys = (
+    'config_file',
+    'log_level',
+    'no_color',
+    'profile',
+    'region'
+)
+
 # -----------------------------------------------------------------------------
 # Shared options
 shared_options = [
@@ -81,21 +100,25 @@ def add_options(options):
     return _add_options
 
 
+# Decorator applying all shared options, composed once at import
+add_shared_options = add_options(shared_options)
+
+
 # -------------------------------------------------
 # Get Config
 def get_config(cli_context):
     """
     Process AWS MP utils config.
 
-    Use ChainMap to build config values based on
-    command line args, config and defaults.
+    Build config values based on command line args, config
+    and defaults. Command line args take precedence over the
+    config file which takes precedence over the defaults.
     """
     config_file_path = cli_context['config_file'] or default_config_file
 
     config_values = {}
     try:
-        with open(config_file_path) as config_file:
-            config_values = yaml.safe_load(config_file)
+        config_values = load_config(config_file_path) or {}
     except FileNotFoundError:
         echo_style(
             f'Config file: {config_file_path} not found. Using default '
@@ -106,20 +129,43 @@ def get_config(cli_context):
     cli_values = {
         key: value for key, value in cli_context.items() if value is not None
     }
-    data = ChainMap(cli_values, config_values, config_defaults)
+    data = {**config_defaults, **config_values, **cli_values}
 
-    config_data = None
-    try:
-        config_data = aws_mp_utils_config(**data)
-    except TypeError as e:
+    unknown_keys = data.keys() - set(aws_mp_utils_config._fields)
+    if unknown_keys:
         echo_style(
             f'Found unknown keyword in config file {config_file_path}',
             no_color=True
         )
-        echo_style(str(e), no_color=True)
+        echo_style(
+            f'Unknown keywords: {", ".join(sorted(unknown_keys))}',
+            no_color=True
+        )
         sys.exit(1)
 
-    return config_data
+    return aws_mp_utils_config._make(
+        data[field] for field in aws_mp_utils_config._fields
+    )
+
+
+def load_config(config_file_path):
+    """
+    Return the values parsed from the given config file.
+
+    Parsed values are cached per path and modification time so an
+    unchanged file is only read once per process.
+    """
+    import yaml
+
+    # Prefer the libyaml based loader when PyYAML is built with it
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    key = (config_file_path, os.stat(config_file_path).st_mtime_ns)
+
+    if key not in _config_cache:
+        with open(config_file_path) as config_file:
+            _config_cache[key] = yaml.load(config_file, Loader=loader)
+
+    return _config_cache[key]
 
 
 # -----------------------------------------------------------------------------
@@ -140,23 +186,37 @@ def process_shared_options(context_obj, kwargs):
     """
     Update context with values for shared options.
     """
-    context_obj['config_file'] = kwargs.get('config_file')
-    context_obj['log_level'] = kwargs.get('log_level')
-    context_obj['no_color'] = kwargs.get('no_color')
-    context_obj['profile'] = kwargs.get('profile')
-    context_obj['region'] = kwargs.get('region')
+    context_obj.update({key: kwargs.get(key) for key in shared_option_keys})
 
 
 # -----------------------------------------------------------------------------
 def get_mp_client(profile, region):
     """
     Return a authenticated client given the profile and region.
+
+    Clients are cached per profile and region for the life of the process.
     """
-    session = get_session(profile_name=profile)
+    return _cached_client(profile, region)
+
+
+@lru_cache(maxsize=None)
+def _cached_session(profile):
+    from aws_mp_utils.auth import get_session
+
+    return get_session(profile_name=profile)
+
+
+@lru_cache(maxsize=None)
+def _cached_client(profile, region):
+    from botocore.config import Config
+
+    from aws_mp_utils.auth import get_client
+
     return get_client(
         'marketplace-catalog',
         region,
-        session
+        _cached_session(profile),
+        config=Config(**mp_client_config)
     )
 
 
@@ -31,10 +31,9 @@ from aws_mp_utils.container import (
 )
 from aws_mp_utils.changeset import start_mp_change_set
 from aws_mp_utils.scripts.cli_utils import (
-    add_options,
+    add_shared_options,
     get_config,
     process_shared_options,
-    shared_options,
     echo_style,
     get_mp_client,
     handle_errors,
@@ -63,8 +62,8 @@ def container():
 @click.option(
     '--conflict-wait-period',
     type=click.IntRange(min=0),
-    help='The period (in seconds) that is waited between checks for the '
-         'ongoing mp change to be finished.'
+    help='The maximum period (in seconds) that is waited for the ongoing '
+         'mp change to be finished before the change is resubmitted.'
 )
 @click.option(
     '--add-override-parameters',
@@ -163,7 +162,7 @@ def container():
     default='AWSMarketplace',
     help='The catalog related to the request.'
 )
-@add_options(shared_options)
+@add_shared_options
 @click.pass_context
 def add_version(
     context,
@@ -262,8 +261,8 @@ def add_version(
 @click.option(
     '--conflict-wait-period',
     type=click.IntRange(min=0),
-    help='The period (in seconds) that is waited between checks for the '
-         'ongoing mp change to be finished.'
+    help='The maximum period (in seconds) that is waited for the ongoing '
+         'mp change to be finished before the change is resubmitted.'
 )
 @click.option(
     '--add-override-parameters',
@@ -361,7 +360,7 @@ def add_version(
     default='AWSMarketplace',
     help='The catalog related to the request.'
 )
-@add_options(shared_options)
+@add_shared_options
 @click.pass_context
 def update_version(
     context,
@@ -31,11 +31,11 @@ from aws_mp_utils.image import (
     create_restrict_version_change_doc
 )
 from aws_mp_utils.changeset import start_mp_change_set
+from aws_mp_utils.exceptions import AWSMPImageProductException
 from aws_mp_utils.scripts.cli_utils import (
-    add_options,
+    add_shared_options,
     get_config,
     process_shared_options,
-    shared_options,
     echo_style,
     get_mp_client,
     ingress_rule_repl,
@@ -64,8 +64,8 @@ def image():
 @click.option(
     '--conflict-wait-period',
     type=click.IntRange(min=0),
-    help='The period (in seconds) that is waited between checks for the '
-         'ongoing mp change to be finished.'
+    help='The maximum period (in seconds) that is waited for the ongoing '
+         'mp change to be finished before the change is resubmitted.'
 )
 @click.option(
     '--entity-id',
@@ -86,7 +86,7 @@ def image():
     default='AWSMarketplace',
     help='The catalog related to the request.'
 )
-@add_options(shared_options)
+@add_shared_options
 @click.pass_context
 def restrict_version(
     context,
@@ -115,21 +115,8 @@ def restrict_version(
         config_data.profile,
         config_data.region
     )
-    with handle_errors(config_data.log_level, config_data.no_color):
-        delivery_option_id = get_image_delivery_option_id(
-            client,
-            entity_id,
-            ami_id
-        )
-
-    change_doc = create_restrict_version_change_doc(
-        entity_id,
-        delivery_option_id
-    )
-
     options = {
         'client': client,
-        'change_set': [change_doc],
         'catalog': catalog
     }
 
@@ -139,6 +126,21 @@ def restrict_version(
         options['conflict_wait_period'] = conflict_wait_period
 
     with handle_errors(config_data.log_level, config_data.no_color):
+        delivery_option_id = get_image_delivery_option_id(
+            client,
+            entity_id,
+            ami_id,
+            catalog
+        )
+        if not delivery_option_id:
+            raise AWSMPImageProductException(
+                f'Unable to find a delivery option for {ami_id} '
+                f'in {entity_id}.'
+            )
+
+        options['change_set'] = [
+            create_restrict_version_change_doc(entity_id, delivery_option_id)
+        ]
         response = start_mp_change_set(**options)
 
     output = f'Change set Id: {response["ChangeSetId"]}'
@@ -157,8 +159,8 @@ def restrict_version(
 @click.option(
     '--conflict-wait-period',
     type=click.IntRange(min=0),
-    help='The period (in seconds) that is waited between checks for the '
-         'ongoing mp change to be finished.'
+    help='The maximum period (in seconds) that is waited for the ongoing '
+         'mp change to be finished before the change is resubmitted.'
 )
 @click.option(
     '--add-ingress-rules',
@@ -235,7 +237,7 @@ def restrict_version(
     default='AWSMarketplace',
     help='The catalog related to the request.'
 )
-@add_options(shared_options)
+@add_shared_options
 @click.pass_context
 def add_version(
     context,
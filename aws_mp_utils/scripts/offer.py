@@ -22,7 +22,6 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import logging
-import sys
 import json
 
 import click
@@ -40,10 +39,9 @@ from aws_mp_utils.offer_instance_types import (
     create_restrict_instance_types_change_doc
 )
 from aws_mp_utils.scripts.cli_utils import (
-    add_options,
+    add_shared_options,
     get_config,
     process_shared_options,
-    shared_options,
     echo_style,
     get_mp_client,
     handle_errors
@@ -71,8 +69,8 @@ def offer():
 @click.option(
     '--conflict-wait-period',
     type=click.IntRange(min=0),
-    help='The period (in seconds) that is waited between checks for the '
-         'ongoing mp change to be finished.'
+    help='The maximum period (in seconds) that is waited for the ongoing '
+         'mp change to be finished before the change is resubmitted.'
 )
 @click.option(
     '--offer-id',
@@ -107,7 +105,7 @@ def offer():
     default='AWSMarketplace',
     help='The catalog related to the request.'
 )
-@add_options(shared_options)
+@add_shared_options
 @click.pass_context
 def update_information(
     context,
@@ -181,7 +179,7 @@ def update_information(
     default='AWSMarketplace',
     help='The catalog related to the request.'
 )
-@add_options(shared_options)
+@add_shared_options
 @click.pass_context
 def list_dimensions(
     context,
@@ -194,12 +192,12 @@ def list_dimensions(
 
     """
 
-    try:
-        process_shared_options(context.obj, kwargs)
-        config_data = get_config(context.obj)
-        logger = logging.getLogger('aws_mp_utils')
-        logger.setLevel(config_data.log_level)
+    process_shared_options(context.obj, kwargs)
+    config_data = get_config(context.obj)
+    logger = logging.getLogger('aws_mp_utils')
+    logger.setLevel(config_data.log_level)
 
+    with handle_errors(config_data.log_level, config_data.no_color):
         client = get_mp_client(
             config_data.profile,
             config_data.region
@@ -224,11 +222,6 @@ def list_dimensions(
         else:
             output = ('No dimensions were found')
             echo_style(output, config_data.no_color, fg='red')
-    except Exception as e:
-        output = str(e)
-        no_color = kwargs.get('no_color', False)
-        echo_style(output, no_color, fg='red')
-        sys.exit(1)
 
 
 # -----------------------------------------------------------------------------
@@ -244,8 +237,8 @@ def list_dimensions(
 @click.option(
     '--conflict-wait-period',
     type=click.IntRange(min=0),
-    help='The period (in seconds) that is waited between checks for the '
-         'ongoing mp change to be finished.'
+    help='The maximum period (in seconds) that is waited for the ongoing '
+         'mp change to be finished before the change is resubmitted.'
 )
 @click.option(
     '--offer-id',
@@ -275,7 +268,7 @@ def list_dimensions(
     help='A path to a file containing a JSON formatted string with the '
          'details document for restricting the offer dimensions.'
 )
-@add_options(shared_options)
+@add_shared_options
 @click.pass_context
 def restrict_dimensions(
     context,
@@ -319,12 +312,12 @@ def restrict_dimensions(
             "dimensions in an offer."
         )
 
-    try:
-        process_shared_options(context.obj, kwargs)
-        config_data = get_config(context.obj)
-        logger = logging.getLogger('aws_mp_utils')
-        logger.setLevel(config_data.log_level)
+    process_shared_options(context.obj, kwargs)
+    config_data = get_config(context.obj)
+    logger = logging.getLogger('aws_mp_utils')
+    logger.setLevel(config_data.log_level)
 
+    with handle_errors(config_data.log_level, config_data.no_color):
         client = get_mp_client(
             config_data.profile,
             config_data.region
@@ -346,16 +339,10 @@ def restrict_dimensions(
             options['max_rechecks'] = max_rechecks
         if conflict_wait_period:
             options['conflict_wait_period'] = conflict_wait_period
-        with handle_errors(config_data.log_level, config_data.no_color):
-            response = start_mp_change_set(**options)
+        response = start_mp_change_set(**options)
 
         output = f'Change set Id: {response["ChangeSetId"]}'
         echo_style(output, config_data.no_color, fg='green')
-    except Exception as e:
-        output = str(e)
-        no_color = kwargs.get('no_color', False)
-        echo_style(output, no_color, fg='red')
-        sys.exit(1)
 
 
 # -----------------------------------------------------------------------------
@@ -371,8 +358,8 @@ def restrict_dimensions(
 @click.option(
     '--conflict-wait-period',
     type=click.IntRange(min=0),
-    help='The period (in seconds) that is waited between checks for the '
-         'ongoing mp change to be finished.'
+    help='The maximum period (in seconds) that is waited for the ongoing '
+         'mp change to be finished before the change is resubmitted.'
 )
 @click.option(
     '--offer-id',
@@ -402,7 +389,7 @@ def restrict_dimensions(
         'details document for adding the offer dimensions.'
     )
 )
-@add_options(shared_options)
+@add_shared_options
 @click.pass_context
 def add_dimensions(
     context,
@@ -446,12 +433,12 @@ def add_dimensions(
             "dimensions in an offer."
         )
 
-    try:
-        process_shared_options(context.obj, kwargs)
-        config_data = get_config(context.obj)
-        logger = logging.getLogger('aws_mp_utils')
-        logger.setLevel(config_data.log_level)
+    process_shared_options(context.obj, kwargs)
+    config_data = get_config(context.obj)
+    logger = logging.getLogger('aws_mp_utils')
+    logger.setLevel(config_data.log_level)
 
+    with handle_errors(config_data.log_level, config_data.no_color):
         client = get_mp_client(
             config_data.profile,
             config_data.region
@@ -473,16 +460,10 @@ def add_dimensions(
             options['max_rechecks'] = max_rechecks
         if conflict_wait_period:
             options['conflict_wait_period'] = conflict_wait_period
-        with handle_errors(config_data.log_level, config_data.no_color):
-            response = start_mp_change_set(**options)
+        response = start_mp_change_set(**options)
 
         output = f'Change set Id: {response["ChangeSetId"]}'
         echo_style(output, config_data.no_color, fg='green')
-    except Exception as e:
-        output = str(e)
-        no_color = kwargs.get('no_color', False)
-        echo_style(output, no_color, fg='red')
-        sys.exit(1)
 
 
 # -----------------------------------------------------------------------------
@@ -500,7 +481,7 @@ def add_dimensions(
     default='AWSMarketplace',
     help='The catalog related to the request.'
 )
-@add_options(shared_options)
+@add_shared_options
 @click.pass_context
 def list_available_instance_types(
     context,
@@ -513,12 +494,12 @@ def list_available_instance_types(
 
     """
 
-    try:
-        process_shared_options(context.obj, kwargs)
-        config_data = get_config(context.obj)
-        logger = logging.getLogger('aws_mp_utils')
-        logger.setLevel(config_data.log_level)
+    process_shared_options(context.obj, kwargs)
+    config_data = get_config(context.obj)
+    logger = logging.getLogger('aws_mp_utils')
+    logger.setLevel(config_data.log_level)
 
+    with handle_errors(config_data.log_level, config_data.no_color):
         client = get_mp_client(
             config_data.profile,
             config_data.region
@@ -540,11 +521,6 @@ def list_available_instance_types(
         else:
             output = ('No available instance types were found')
             echo_style(output, config_data.no_color, fg='red')
-    except Exception as e:
-        output = str(e)
-        no_color = kwargs.get('no_color', False)
-        echo_style(output, no_color, fg='red')
-        sys.exit(1)
 
 
 # -----------------------------------------------------------------------------
@@ -560,8 +536,8 @@ def list_available_instance_types(
 @click.option(
     '--conflict-wait-period',
     type=click.IntRange(min=0),
-    help='The period (in seconds) that is waited between checks for the '
-         'ongoing mp change to be finished.'
+    help='The maximum period (in seconds) that is waited for the ongoing '
+         'mp change to be finished before the change is resubmitted.'
 )
 @click.option(
     '--offer-id',
@@ -582,7 +558,7 @@ def list_available_instance_types(
     help='A comma separated list of containing the instance types that will '
          'be restricted in the offer.'
 )
-@add_options(shared_options)
+@add_shared_options
 @click.pass_context
 def restrict_instance_types(
     context,
@@ -604,12 +580,12 @@ def restrict_instance_types(
         )
     instance_types = instance_types.split(',')
 
-    try:
-        process_shared_options(context.obj, kwargs)
-        config_data = get_config(context.obj)
-        logger = logging.getLogger('aws_mp_utils')
-        logger.setLevel(config_data.log_level)
+    process_shared_options(context.obj, kwargs)
+    config_data = get_config(context.obj)
+    logger = logging.getLogger('aws_mp_utils')
+    logger.setLevel(config_data.log_level)
 
+    with handle_errors(config_data.log_level, config_data.no_color):
         client = get_mp_client(
             config_data.profile,
             config_data.region
@@ -631,16 +607,10 @@ def restrict_instance_types(
             options['max_rechecks'] = max_rechecks
         if conflict_wait_period:
             options['conflict_wait_period'] = conflict_wait_period
-        with handle_errors(config_data.log_level, config_data.no_color):
-            response = start_mp_change_set(**options)
+        response = start_mp_change_set(**options)
 
         output = f'Change set Id: {response["ChangeSetId"]}'
         echo_style(output, config_data.no_color, fg='green')
-    except Exception as e:
-        output = str(e)
-        no_color = kwargs.get('no_color', False)
-        echo_style(output, no_color, fg='red')
-        sys.exit(1)
 
 
 # -----------------------------------------------------------------------------
@@ -656,8 +626,8 @@ def restrict_instance_types(
 @click.option(
     '--conflict-wait-period',
     type=click.IntRange(min=0),
-    help='The period (in seconds) that is waited between checks for the '
-         'ongoing mp change to be finished.'
+    help='The maximum period (in seconds) that is waited for the ongoing '
+         'mp change to be finished before the change is resubmitted.'
 )
 @click.option(
     '--offer-id',
@@ -678,7 +648,7 @@ def restrict_instance_types(
     help='A comma separated list of containing the instance types that will '
          'be added to the offer.'
 )
-@add_options(shared_options)
+@add_shared_options
 @click.pass_context
 def add_instance_types(
     context,
@@ -701,12 +671,12 @@ def add_instance_types(
         )
     instance_types = instance_types.split(',')
 
-    try:
-        process_shared_options(context.obj, kwargs)
-        config_data = get_config(context.obj)
-        logger = logging.getLogger('aws_mp_utils')
-        logger.setLevel(config_data.log_level)
+    process_shared_options(context.obj, kwargs)
+    config_data = get_config(context.obj)
+    logger = logging.getLogger('aws_mp_utils')
+    logger.setLevel(config_data.log_level)
 
+    with handle_errors(config_data.log_level, config_data.no_color):
         client = get_mp_client(
             config_data.profile,
             config_data.region
@@ -728,13 +698,7 @@ def add_instance_types(
             options['max_rechecks'] = max_rechecks
         if conflict_wait_period:
             options['conflict_wait_period'] = conflict_wait_period
-        with handle_errors(config_data.log_level, config_data.no_color):
-            response = start_mp_change_set(**options)
+        response = start_mp_change_set(**options)
 
         output = f'Change set Id: {response["ChangeSetId"]}'
         echo_style(output, config_data.no_color, fg='green')
-    except Exception as e:
-        output = str(e)
-        no_color = kwargs.get('no_color', False)
-        echo_style(output, no_color, fg='red')
-        sys.exit(1)
@@ -39,10 +39,12 @@ BuildRequires:  %{pythons}-jmespath
 BuildRequires:  %{pythons}-click
 BuildRequires:  %{pythons}-PyYAML
 BuildRequires:  %{pythons}-boto3
+BuildRequires:  %{pythons}-botocore >= 1.27
 Requires:       %{pythons}-jmespath
 Requires:       %{pythons}-click
 Requires:       %{pythons}-PyYAML
 Requires:       %{pythons}-boto3
+Requires:       %{pythons}-botocore >= 1.27
 BuildArch:      noarch
 
 %description
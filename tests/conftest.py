@@ -0,0 +1,41 @@
+import pytest
+
+from types import SimpleNamespace
+
+# Contents of tests/data/config.yaml
+TEST_CONFIG = {
+    'region': 'us-east-1'
+}
+
+
+@pytest.fixture
+def stub_config(monkeypatch):
+    """Serve the test config from memory instead of parsing the file."""
+    monkeypatch.setattr(
+        'aws_mp_utils.scripts.cli_utils.load_config',
+        lambda config_file_path: dict(TEST_CONFIG)
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Never wait on change set backoff or polling in tests."""
+    monkeypatch.setattr(
+        'aws_mp_utils.changeset.time.sleep',
+        lambda *args: None
+    )
+
+
+@pytest.fixture
+def fake_client():
+    """
+    Build a lightweight client whose methods return canned responses.
+
+    Use a Mock with spec_set instead when calls need to be asserted.
+    """
+    def _client(**responses):
+        return SimpleNamespace(**{
+            name: (lambda *args, _response=response, **kwargs: _response)
+            for name, response in responses.items()
+        })
+    return _client
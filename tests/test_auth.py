@@ -36,4 +36,5 @@ def test_get_client(mock_boto3):
     session.client.assert_called_once_with(
         service_name='marketplace-catalog',
         region_name='us-east-1',
+        config=None
     )
@@ -1,22 +1,33 @@
 import json
+import types
 
-import botocore.session
-import botocore.errorfactory
+import boto3
 import pytest
 
-from unittest.mock import call, Mock
+from botocore.exceptions import ClientError
+from botocore.stub import Stubber
+from unittest.mock import Mock, patch
 
 from aws_mp_utils.image import create_add_version_change_doc
 from aws_mp_utils.changeset import (
+    _backoff,
+    _status_cache,
     get_change_set,
     get_change_set_status,
-    start_mp_change_set
+    start_mp_change_set,
+    wait_for_change_set
 )
 
-# botocore ClientExceptionFactory
-model = botocore.session.get_session().get_service_model('marketplace-catalog')
-factory = botocore.errorfactory.ClientExceptionsFactory()
-exceptions = factory.create_client_exceptions(model)
+
+class _AccessDeniedException(ClientError):
+    pass
+
+
+class _Exceptions:
+    AccessDeniedException = _AccessDeniedException
+
+
+exceptions = _Exceptions()
 
 data = {
     'ChangeType': 'AddDeliveryOptions',
@@ -53,13 +64,44 @@ details = {
     }]
 }
 data['Details'] = json.dumps(details)
-start_changeset_params = {
+start_changeset_params = types.MappingProxyType({
     'Catalog': 'AWSMarketplace',
     'ChangeSet': [data],
-}
+})
+
+
+@pytest.fixture(autouse=True)
+def clear_status_cache():
+    _status_cache.clear()
 
 
-def test_get_change_set():
+@pytest.fixture(scope='session')
+def add_version_change_set():
+    return create_add_version_change_doc(
+        entity_id='123',
+        version_title='New image',
+        ami_id='ami-123',
+        access_role_arn='arn',
+        release_notes='Release Notes',
+        os_name='OTHERLINUX',
+        os_version='15.3',
+        usage_instructions='Login with SSH...',
+        recommended_instance_type='t3.medium',
+        ssh_user='ec2-user'
+    )
+
+
+@pytest.fixture(scope='module')
+def mp_client():
+    return boto3.client(
+        'marketplace-catalog',
+        region_name='us-east-1',
+        aws_access_key_id='testing',
+        aws_secret_access_key='testing'
+    )
+
+
+def test_get_change_set(mp_client):
     response = {
         'ChangeSetId': '123',
         'ChangeSetArn': 'string',
@@ -82,14 +124,19 @@ def test_get_change_set():
         ]
     }
 
-    client = Mock()
-    client.describe_change_set.return_value = response
+    with Stubber(mp_client) as stubber:
+        stubber.add_response(
+            'describe_change_set',
+            response,
+            {'Catalog': 'AWSMarketplace', 'ChangeSetId': '123'}
+        )
+        response = get_change_set(mp_client, '123')
+        stubber.assert_no_pending_responses()
 
-    response = get_change_set(client, '123')
     assert response['ChangeSetId'] == '123'
 
 
-def test_get_change_set_status():
+def test_get_change_set_status(mp_client):
     response = {
         'Status': 'SUCCEEDED',
         'ChangeSet': [
@@ -106,162 +153,295 @@ def test_get_change_set_status():
         ]
     }
 
-    client = Mock()
-    client.describe_change_set.return_value = response
+    with Stubber(mp_client) as stubber:
+        stubber.add_response(
+            'describe_change_set',
+            response,
+            {'Catalog': 'AWSMarketplace', 'ChangeSetId': '123'}
+        )
+        stubber.add_response(
+            'describe_change_set',
+            response,
+            {'Catalog': 'AWSMarketplace-aws-eusc', 'ChangeSetId': '123'}
+        )
+
+        assert get_change_set_status(mp_client, '123') == 'succeeded'
+
+        # Terminal status is served from the cache
+        assert get_change_set_status(mp_client, '123') == 'succeeded'
+
+        # Cache is per catalog
+        get_change_set_status(mp_client, '123', 'AWSMarketplace-aws-eusc')
+        stubber.assert_no_pending_responses()
+
 
-    response = get_change_set_status(client, '123')
-    assert response == 'succeeded'
+def test_get_change_set_status_not_cached(mp_client):
+    with Stubber(mp_client) as stubber:
+        for _ in range(2):
+            stubber.add_response(
+                'describe_change_set',
+                {'Status': 'APPLYING'},
+                {'Catalog': 'AWSMarketplace', 'ChangeSetId': '123'}
+            )
 
+        assert get_change_set_status(mp_client, '123') == 'applying'
+        assert get_change_set_status(mp_client, '123') == 'applying'
+        stubber.assert_no_pending_responses()
 
-def test_start_mp_change_set():
-    client = Mock()
+
+def test_start_mp_change_set(add_version_change_set):
+    client = Mock(spec_set=['start_change_set'])
     client.start_change_set.return_value = {
         'ChangeSetId': '123'
     }
 
-    change_set = create_add_version_change_doc(
-        entity_id='123',
-        version_title='New image',
-        ami_id='ami-123',
-        access_role_arn='arn',
-        release_notes='Release Notes',
-        os_name='OTHERLINUX',
-        os_version='15.3',
-        usage_instructions='Login with SSH...',
-        recommended_instance_type='t3.medium',
-        ssh_user='ec2-user'
-    )
-
     response = start_mp_change_set(
         client,
-        [change_set]
+        [add_version_change_set]
     )
 
     assert response['ChangeSetId'] == '123'
     client.start_change_set.assert_called_once_with(**start_changeset_params)
 
 
-def test_start_mp_change_set_ongoing_change_ResourceInUseException():
-
-    def generate_exception():
-        error_code = 'ResourceInUseException'
-        error_message = (
-            "Requested change set has entities locked by change sets"
-            " - entity: '6066beac-a43b-4ad0-b5fe-f503025e4747' "
-            " change sets: dgoddlepi9nb3ynwrwlkr3be4"
+@pytest.mark.parametrize(
+    'error_code,error_message,expected_calls,expected_error',
+    [
+        (
+            'ResourceInUseException',
+            'Requested change set has entities locked by change sets'
+            ' - entity: \'6066beac-a43b-4ad0-b5fe-f503025e4747\' '
+            ' change sets: dgoddlepi9nb3ynwrwlkr3be4',
+            10,
+            'AWSMPUtilsException'
+        ),
+        (
+            'AccessDeniedException',
+            'AccessDeniedException',
+            1,
+            'AccessDeniedException'
         )
-        exc_data = {
-            "Error": {
-                "Code": error_code,
-                "Message": error_message
+    ]
+)
+def test_start_mp_change_set_ongoing_change(
+    error_code,
+    error_message,
+    expected_calls,
+    expected_error,
+    add_version_change_set
+):
+    exc_data = {
+        "Error": {
+            "Code": error_code,
+            "Message": error_message
+        },
+        "ResponseMetadata": {
+            "RequestId": "aaaabbbb-cccc-dddd-eeee-ffff00001111",
+            "HTTPStatusCode": 400,
+            "HTTPHeaders": {
+                "transfer-encoding": "chunked",
+                "date": "Fri, 01 Jan 2100 00:00:00 GMT",
+                "connection": "close",
+                "server": "AmazonEC2"
             },
-            "ResponseMetadata": {
-                "RequestId": "aaaabbbb-cccc-dddd-eeee-ffff00001111",
-                "HTTPStatusCode": 400,
-                "HTTPHeaders": {
-                    "transfer-encoding": "chunked",
-                    "date": "Fri, 01 Jan 2100 00:00:00 GMT",
-                    "connection": "close",
-                    "server": "AmazonEC2"
-                },
-                "RetryAttempts": 0
-            }
+            "RetryAttempts": 0
         }
+    }
 
-        return exceptions.AccessDeniedException(
+    client = Mock(
+        spec_set=['start_change_set', 'describe_change_set', 'exceptions']
+    )
+    client.exceptions.AccessDeniedException = \
+        exceptions.AccessDeniedException
+    client.start_change_set.side_effect = \
+        exceptions.AccessDeniedException(
             error_response=exc_data,
             operation_name='start_change_set'
         )
-
-    client = Mock()
-    client.exceptions.AccessDeniedException = exceptions.AccessDeniedException
-    client.start_change_set.side_effect = generate_exception()
-
-    change_set = create_add_version_change_doc(
-        entity_id='123',
-        version_title='New image',
-        ami_id='ami-123',
-        access_role_arn='arn',
-        release_notes='Release Notes',
-        os_name='OTHERLINUX',
-        os_version='15.3',
-        usage_instructions='Login with SSH...',
-        recommended_instance_type='t3.medium',
-        ssh_user='ec2-user'
-    )
+    client.describe_change_set.return_value = {'Status': 'APPLYING'}
 
     with pytest.raises(Exception) as error:
         start_mp_change_set(
             client,
-            change_set=[change_set],
+            change_set=[add_version_change_set],
             max_rechecks=10,
             conflict_wait_period=0
         )
-    assert 'AWSMPUtilsException' in str(error)
-    client.start_change_set.assert_has_calls(
-        [
-            call(**start_changeset_params),
-            call(**start_changeset_params)
-        ],
-        any_order=True
+    assert expected_error in str(error)
+    assert client.start_change_set.call_count == expected_calls
+    client.start_change_set.assert_called_with(**start_changeset_params)
+
+
+_LOCKED_MESSAGE = (
+    'Requested change set has entities locked by change sets'
+    ' - entity: \'6066beac-a43b-4ad0-b5fe-f503025e4747\' '
+    ' change sets: dgoddlepi9nb3ynwrwlkr3be4'
+)
+_LOCKED_PARAMS = {
+    'Catalog': 'AWSMarketplace',
+    'ChangeSetId': 'dgoddlepi9nb3ynwrwlkr3be4'
+}
+
+
+def _add_locked_error(stubber):
+    stubber.add_client_error(
+        'start_change_set',
+        service_error_code='ResourceInUseException',
+        service_message=_LOCKED_MESSAGE,
+        http_status_code=400,
+        expected_params=start_changeset_params
     )
 
 
-def test_start_mp_change_set_ongoing_change_GenericBotoException():
+@patch('aws_mp_utils.changeset.time.sleep')
+def test_start_mp_change_set_ongoing_change_finished(mock_sleep, mp_client):
+    with Stubber(mp_client) as stubber:
+        _add_locked_error(stubber)
+        stubber.add_response(
+            'describe_change_set',
+            {'Status': 'APPLYING'},
+            _LOCKED_PARAMS
+        )
+        stubber.add_response(
+            'describe_change_set',
+            {'Status': 'SUCCEEDED'},
+            _LOCKED_PARAMS
+        )
+        stubber.add_response(
+            'start_change_set',
+            {'ChangeSetId': '123'},
+            start_changeset_params
+        )
 
-    def generate_exception():
-        error_code = 'AccessDeniedException'
-        error_message = "AccessDeniedException"
-        exc_data = {
-            "Error": {
-                "Code": error_code,
-                "Message": error_message
-            },
-            "ResponseMetadata": {
-                "RequestId": "aaaabbbb-cccc-dddd-eeee-ffff00001111",
-                "HTTPStatusCode": 400,
-                "HTTPHeaders": {
-                    "transfer-encoding": "chunked",
-                    "date": "Fri, 01 Jan 2100 00:00:00 GMT",
-                    "connection": "close",
-                    "server": "AmazonEC2"
-                },
-                "RetryAttempts": 0
-            }
-        }
+        response = start_mp_change_set(mp_client, change_set=[data])
+        stubber.assert_no_pending_responses()
 
-        return exceptions.AccessDeniedException(
-            error_response=exc_data,
-            operation_name='start_change_set'
+    assert response['ChangeSetId'] == '123'
+    mock_sleep.assert_not_called()
+
+
+@patch('aws_mp_utils.changeset.time.sleep')
+def test_start_mp_change_set_finished_change_reported_again(
+    mock_sleep,
+    mp_client
+):
+    with Stubber(mp_client) as stubber:
+        _add_locked_error(stubber)
+        stubber.add_response(
+            'describe_change_set',
+            {'Status': 'SUCCEEDED'},
+            _LOCKED_PARAMS
+        )
+        # Same finished change set is reported again, status is cached
+        _add_locked_error(stubber)
+        stubber.add_response(
+            'start_change_set',
+            {'ChangeSetId': '123'},
+            start_changeset_params
         )
 
-    client = Mock()
-    client.exceptions.AccessDeniedException = exceptions.AccessDeniedException
-    client.start_change_set.side_effect = generate_exception()
+        response = start_mp_change_set(
+            mp_client,
+            change_set=[data],
+            conflict_wait_period=10
+        )
+        stubber.assert_no_pending_responses()
 
-    change_set = create_add_version_change_doc(
-        entity_id='123',
-        version_title='New image',
-        ami_id='ami-123',
-        access_role_arn='arn',
-        release_notes='Release Notes',
-        os_name='OTHERLINUX',
-        os_version='15.3',
-        usage_instructions='Login with SSH...',
-        recommended_instance_type='t3.medium',
-        ssh_user='ec2-user'
-    )
+    assert response['ChangeSetId'] == '123'
+    assert mock_sleep.call_count == 2
+    for sleep_call in mock_sleep.call_args_list:
+        assert 0 <= sleep_call.args[0] <= 10
+
+
+@patch('aws_mp_utils.changeset.time.sleep')
+def test_start_mp_change_set_ongoing_change_not_readable(
+    mock_sleep,
+    mp_client
+):
+    with Stubber(mp_client) as stubber:
+        _add_locked_error(stubber)
+        stubber.add_client_error(
+            'describe_change_set',
+            service_error_code='AccessDeniedException',
+            http_status_code=403,
+            expected_params=_LOCKED_PARAMS
+        )
+        stubber.add_response(
+            'start_change_set',
+            {'ChangeSetId': '123'},
+            start_changeset_params
+        )
 
-    with pytest.raises(Exception) as error:
-        start_mp_change_set(
-            client,
-            change_set=[change_set],
-            max_rechecks=10,
-            conflict_wait_period=0
+        response = start_mp_change_set(
+            mp_client,
+            change_set=[data],
+            conflict_wait_period=10
         )
-    assert 'AccessDeniedException' in str(error)
-    client.start_change_set.assert_has_calls(
-        [
-            call(**start_changeset_params),
-        ],
+        stubber.assert_no_pending_responses()
+
+    assert response['ChangeSetId'] == '123'
+    mock_sleep.assert_called_once()
+    assert 0 <= mock_sleep.call_args.args[0] <= 10
+
+
+@patch('aws_mp_utils.changeset.time.sleep')
+def test_start_mp_change_set_unknown_ongoing_change(mock_sleep):
+    error = ClientError(
+        error_response={
+            'Error': {
+                'Code': 'ResourceInUseException',
+                'Message': 'Requested change set has entities locked'
+            }
+        },
+        operation_name='start_change_set'
+    )
+
+    client = Mock(spec_set=['start_change_set', 'describe_change_set'])
+    client.start_change_set.side_effect = [error, {'ChangeSetId': '123'}]
+
+    response = start_mp_change_set(
+        client,
+        change_set=[{}],
+        conflict_wait_period=10
     )
+
+    assert response['ChangeSetId'] == '123'
+    client.describe_change_set.assert_not_called()
+    mock_sleep.assert_called_once()
+    assert 0 <= mock_sleep.call_args.args[0] <= 10
+
+
+@patch('aws_mp_utils.changeset.time.sleep')
+def test_wait_for_change_set(mock_sleep):
+    client = Mock(spec_set=['describe_change_set'])
+    client.describe_change_set.side_effect = [
+        {'Status': 'PREPARING'},
+        {'Status': 'APPLYING'},
+        {'Status': 'SUCCEEDED'}
+    ]
+
+    assert wait_for_change_set(client, '123', 1800)
+    assert client.describe_change_set.call_count == 3
+    assert mock_sleep.call_count == 2
+    for sleep_call in mock_sleep.call_args_list:
+        assert sleep_call.args[0] <= 60
+
+
+@patch('aws_mp_utils.changeset.time.monotonic')
+@patch('aws_mp_utils.changeset.time.sleep')
+def test_wait_for_change_set_timeout(mock_sleep, mock_monotonic):
+    mock_monotonic.side_effect = [0, 10, 30]
+    client = Mock(spec_set=['describe_change_set'])
+    client.describe_change_set.return_value = {'Status': 'APPLYING'}
+
+    assert not wait_for_change_set(client, '123', 20)
+    assert client.describe_change_set.call_count == 2
+    mock_sleep.assert_called_once()
+    assert mock_sleep.call_args.args[0] <= 10
+
+
+def test_backoff():
+    for attempt in range(10):
+        assert 2 <= _backoff(attempt, cap=1800) <= min(1800, 2 * 3 ** attempt)
+
+    assert _backoff(5, cap=0) == 0
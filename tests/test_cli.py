@@ -1,4 +1,4 @@
-import json
+import pytest
 
 from unittest.mock import patch, Mock
 
@@ -6,18 +6,23 @@ from click.testing import CliRunner
 
 from aws_mp_utils.scripts.cli import main
 
+pytestmark = pytest.mark.usefixtures('stub_config')
 
-def test_client_help():
+
+@pytest.fixture(scope='module')
+def runner():
+    return CliRunner()
+
+
+def test_client_help(runner):
     """Confirm aws mp utils --help is successful."""
-    runner = CliRunner()
     result = runner.invoke(main, ['--help'])
     assert result.exit_code == 0
     assert 'The command line interface provides ' \
            'AWS Marketplace Catalog utilities' in result.output
 
 
-def test_print_license():
-    runner = CliRunner()
+def test_print_license(runner):
     result = runner.invoke(main, ['--license'])
     assert result.exit_code == 0
     assert result.output == 'GPLv3+\n'
@@ -25,7 +30,7 @@ def test_print_license():
 
 # -------------------------------------------------
 @patch('aws_mp_utils.scripts.cli.get_mp_client')
-def test_describe_change_set(mock_client):
+def test_describe_change_set(mock_client, runner):
     """Confirm describe change set"""
     change_set = {
         'ChangeSetId': '12345',
@@ -48,7 +53,7 @@ def test_describe_change_set(mock_client):
             },
         ]
     }
-    client = Mock()
+    client = Mock(spec_set=['describe_change_set'])
     client.describe_change_set.return_value = change_set
     mock_client.return_value = client
 
@@ -59,14 +64,24 @@ def test_describe_change_set(mock_client):
         '--no-color'
     ]
 
-    runner = CliRunner()
-    result = runner.invoke(main, args)
+    result = runner.invoke(
+        main,
+        args,
+        standalone_mode=False,
+        catch_exceptions=False
+    )
     assert result.exit_code == 0
-    assert json.loads(result.output)['ChangeSetId'] == '12345'
+    assert result.return_value['ChangeSetId'] == '12345'
+    assert '"ChangeSetId": "12345"' in result.output
 
     # Simulate failure in boto3
     client.describe_change_set.side_effect = Exception('403: Auth failure!')
-    result = runner.invoke(main, args)
+    result = runner.invoke(
+        main,
+        args,
+        standalone_mode=False,
+        catch_exceptions=False
+    )
     assert result.exit_code == 1
     assert '403: Auth failure!' in result.output
 
@@ -74,7 +89,7 @@ def test_describe_change_set(mock_client):
 # -------------------------------------------------
 @patch('aws_mp_utils.scripts.cli.get_mp_client')
 @patch('aws_mp_utils.scripts.cli.get_change_set_status')
-def test_get_change_set_status(mock_status, mock_client):
+def test_get_change_set_status(mock_status, mock_client, runner):
     """Confirm get change set status"""
     mock_status.return_value = 'success'
 
@@ -85,7 +100,6 @@ def test_get_change_set_status(mock_status, mock_client):
         '--no-color'
     ]
 
-    runner = CliRunner()
     result = runner.invoke(main, args)
     assert result.exit_code == 0
     assert 'success' in result.output
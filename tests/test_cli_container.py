@@ -1,9 +1,13 @@
+import pytest
+
 from unittest.mock import patch
 
 from click.testing import CliRunner
 
 from aws_mp_utils.scripts.cli import main
 
+pytestmark = pytest.mark.usefixtures('stub_config')
+
 
 # -------------------------------------------------
 @patch('aws_mp_utils.scripts.container.start_mp_change_set')
@@ -1,51 +1,80 @@
+import pytest
+
 from unittest.mock import patch
 
 from click.testing import CliRunner
 
 from aws_mp_utils.scripts.cli import main
 
+pytestmark = pytest.mark.usefixtures('stub_config')
+
+
+@pytest.fixture(scope='module')
+def runner():
+    return CliRunner()
+
+
+_RESTRICT_VERSION_ARGS = (
+    'image', 'restrict-version',
+    '--config-file', 'tests/data/config.yaml',
+    '--entity-id', '00000000-0000-4000-8000-000000000001',
+    '--ami-id', 'ami-12345',
+    '--max-rechecks', 10,
+    '--conflict-wait-period', 300,
+    '--no-color'
+)
+
 
 # -------------------------------------------------
+@pytest.mark.parametrize(
+    'delivery_id,delivery_id_error,start_error,exit_code,output',
+    [
+        ('12345', None, None, 0, 'Change set Id: 123456789'),
+        (
+            '12345', None, Exception('Invalid change set!'),
+            1, 'Invalid change set!'
+        ),
+        (
+            None, None, None,
+            1, 'Unable to find a delivery option for ami-12345'
+        ),
+        (
+            None, Exception('403: Auth failure!'), None,
+            1, '403: Auth failure!'
+        )
+    ],
+    ids=['success', 'start-failure', 'no-delivery-option', 'auth-failure']
+)
 @patch('aws_mp_utils.scripts.image.start_mp_change_set')
 @patch('aws_mp_utils.scripts.image.get_image_delivery_option_id')
 @patch('aws_mp_utils.scripts.image.get_mp_client')
 def test_restrict_version(
     mock_client,
     mock_get_delivery_id,
-    mock_start_change_set
+    mock_start_change_set,
+    delivery_id,
+    delivery_id_error,
+    start_error,
+    exit_code,
+    output,
+    runner
 ):
     """Confirm restrict image version"""
-    mock_get_delivery_id.return_value = '12345'
+    mock_get_delivery_id.return_value = delivery_id
+    mock_get_delivery_id.side_effect = delivery_id_error
     mock_start_change_set.return_value = {
         'ChangeSetId': '123456789'
     }
+    mock_start_change_set.side_effect = start_error
 
-    args = [
-        'image', 'restrict-version',
-        '--config-file', 'tests/data/config.yaml',
-        '--entity-id', '00000000-0000-4000-8000-000000000001',
-        '--ami-id', 'ami-12345',
-        '--max-rechecks', 10,
-        '--conflict-wait-period', 300,
-        '--no-color'
-    ]
-
-    runner = CliRunner()
-    result = runner.invoke(main, args)
-    assert result.exit_code == 0
-    assert 'Change set Id: 123456789' in result.output
-
-    # Failure to start changeset
-    mock_start_change_set.side_effect = Exception('Invalid change set!')
-    result = runner.invoke(main, args)
-    assert result.exit_code == 1
-    assert 'Invalid change set!' in result.output
-
-    # Simulate failure in boto3
-    mock_get_delivery_id.side_effect = Exception('403: Auth failure!')
-    result = runner.invoke(main, args)
-    assert result.exit_code == 1
-    assert '403: Auth failure!' in result.output
+    result = runner.invoke(
+        main,
+        _RESTRICT_VERSION_ARGS,
+        standalone_mode=False,
+        catch_exceptions=False
+    )
+    assert result.exit_code == exit_code
+    assert output in result.output
 
 
 # -------------------------------------------------
@@ -53,7 +82,8 @@ def test_restrict_version(
 @patch('aws_mp_utils.scripts.image.get_mp_client')
 def test_add_version(
     mock_client,
-    mock_start_change_set
+    mock_start_change_set,
+    runner
 ):
     """Confirm restrict image version"""
     mock_start_change_set.return_value = {
@@ -80,7 +110,6 @@ def test_add_version(
         '--no-color'
     ]
 
-    runner = CliRunner()
     result = runner.invoke(
         main,
         args,
@@ -1,6 +1,17 @@
+import pytest
+import yaml
+
 from unittest.mock import Mock, patch
 
-from aws_mp_utils.scripts.cli_utils import get_config, get_mp_client
+from aws_mp_utils.scripts.cli_utils import (
+    _cached_client,
+    _cached_session,
+    get_config,
+    get_mp_client,
+    load_config,
+    mp_client_config,
+    process_shared_options
+)
 
 
 @patch('aws_mp_utils.scripts.cli_utils.echo_style')
@@ -22,12 +33,96 @@ def test_get_config_invalid(mock_echo, mock_exit):
     context = {'config_file': 'tests/data/invalidconfig.yaml'}
     get_config(context)
     mock_exit.assert_called_once_with(1)
+    mock_echo.assert_called_with('Unknown keywords: fake', no_color=True)
+
+
+def test_get_config_precedence(tmp_path):
+    config_file = tmp_path / 'config.yaml'
+    config_file.write_text('region: us-west-2\nprofile: config\n')
+
+    context = {
+        'config_file': str(config_file),
+        'log_level': None,
+        'no_color': None,
+        'profile': 'cli',
+        'region': None
+    }
+    config = get_config(context)
+    assert config.profile == 'cli'
+    assert config.region == 'us-west-2'
+    assert config.no_color is False
+
+
+@patch('yaml.load')
+def test_load_config_cached(mock_load, tmp_path):
+    config_file = tmp_path / 'config.yaml'
+    config_file.write_text('region: us-east-1\n')
+    mock_load.return_value = {'region': 'us-east-1'}
+
+    assert load_config(str(config_file)) == {'region': 'us-east-1'}
+    assert load_config(str(config_file)) == {'region': 'us-east-1'}
+    mock_load.assert_called_once()
+    assert mock_load.call_args.kwargs['Loader'] is getattr(
+        yaml,
+        'CSafeLoader',
+        yaml.SafeLoader
+    )
+
 
+def test_load_config(tmp_path):
+    config_file = tmp_path / 'config.yaml'
+    config_file.write_text('region: us-west-2\nno_color: true\n')
 
-@patch('aws_mp_utils.scripts.cli_utils.get_client')
-@patch('aws_mp_utils.scripts.cli_utils.get_session')
-def test_get_mp_client(mock_get_session, mock_get_client):
+    assert load_config(str(config_file)) == {
+        'region': 'us-west-2',
+        'no_color': True
+    }
+
+
+@pytest.fixture
+def clear_client_caches():
+    """Keep mocked sessions and clients out of the shared caches."""
+    _cached_client.cache_clear()
+    _cached_session.cache_clear()
+    yield
+    _cached_client.cache_clear()
+    _cached_session.cache_clear()
+
+
+@patch('aws_mp_utils.auth.get_client')
+@patch('aws_mp_utils.auth.get_session')
+def test_get_mp_client(
+    mock_get_session,
+    mock_get_client,
+    clear_client_caches
+):
     client = Mock()
     mock_get_client.return_value = client
     res_client = get_mp_client('profile', 'us-east-1')
     assert res_client == client
+    args, kwargs = mock_get_client.call_args
+    assert args == (
+        'marketplace-catalog',
+        'us-east-1',
+        mock_get_session.return_value
+    )
+    assert kwargs['config'].retries == mp_client_config['retries']
+    assert kwargs['config'].tcp_keepalive is True
+
+    # Client is reused for the same profile and region
+    assert get_mp_client('profile', 'us-east-1') == client
+    mock_get_client.assert_called_once()
+    mock_get_session.assert_called_once_with(profile_name='profile')
+
+
+def test_process_shared_options():
+    context = {'other': 'value'}
+    process_shared_options(context, {'profile': 'test', 'debug': True})
+    assert context == {
+        'other': 'value',
+        'config_file': None,
+        'log_level': None,
+        'no_color': None,
+        'profile': 'test',
+        'region': None
+    }
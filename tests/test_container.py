@@ -1,16 +1,42 @@
 
 import json
 
-from unittest.mock import Mock
-
 from aws_mp_utils.container import (
     get_helm_delivery_option_id,
     gen_add_delivery_options_changeset,
     gen_update_delivery_options_changeset
 )
 
+_HELM_ARGS = (
+    '123',
+    'Chart 1.2.3',
+    'Release Notes...',
+    'Chart - 1.2.3',
+    ['EKS'],
+    ['123.dkr.ecr.us-east-1.amazonaws.com/sellername/reponame1:1'],
+    '123.dkr.ecr.us-east-1.amazonaws.com/sellername/reponame1:helmchart1',
+    'Helm chart description',
+    'Usage instructions',
+    True,
+    'Service account name',
+    'Optional release name',
+    'Optional k8s namespace',
+    [
+        {
+            "Key": "HelmKeyName1",
+            "DefaultValue": "${AWSMP_LICENSE_SECRET}",
+            "Metadata":
+            {
+                "Label": "AWS CloudFormation template field label",
+                "Description": "AWS CloudFormation field description",
+                "Obfuscate": False
+            }
+        }
+    ],
+)
+
 
-def test_get_helm_delivery_option_id():
+def test_get_helm_delivery_option_id(fake_client):
     details = {
         "Versions": [
             {
@@ -28,8 +54,7 @@ def test_get_helm_delivery_option_id():
     entity = {
         'DetailsDocument': details
     }
-    client = Mock()
-    client.describe_entity.return_value = entity
+    client = fake_client(describe_entity=entity)
 
     did = get_helm_delivery_option_id(
         client,
@@ -50,66 +75,37 @@ def test_get_helm_delivery_option_id():
     assert did is None
 
 
-def test_gen_add_delivery_options_changeset():
-    response = gen_add_delivery_options_changeset(
-        '123',
-        'Chart 1.2.3',
-        'Release Notes...',
-        'Chart - 1.2.3',
-        ['EKS'],
-        ['123.dkr.ecr.us-east-1.amazonaws.com/sellername/reponame1:1'],
-        '123.dkr.ecr.us-east-1.amazonaws.com/sellername/reponame1:helmchart1',
-        'Helm chart description',
-        'Usage instructions',
-        True,
-        'Service account name',
-        'Optional release name',
-        'Optional k8s namespace',
-        [
+def test_get_helm_delivery_option_id_quoted_title(fake_client):
+    details = {
+        "Versions": [
             {
-                "Key": "HelmKeyName1",
-                "DefaultValue": "${AWSMP_LICENSE_SECRET}",
-                "Metadata":
-                {
-                    "Label": "AWS CloudFormation template field label",
-                    "Description": "AWS CloudFormation field description",
-                    "Obfuscate": False
-                }
+                "VersionTitle": "Product 'beta'",
+                "DeliveryOptions": [
+                    {"Id": "1234", "Type": "EcrImage"},
+                    {"Id": "4321", "Type": "Helm"}
+                ]
             }
         ]
-    )
+    }
+    client = fake_client(describe_entity={'DetailsDocument': details})
+
+    did = get_helm_delivery_option_id(client, '1234589', "Product 'beta'")
+    assert did == '4321'
+
+
+def test_gen_add_delivery_options_changeset():
+    response = gen_add_delivery_options_changeset(*_HELM_ARGS)
     assert 'Details' in response
     assert response['ChangeType'] == 'AddDeliveryOptions'
 
 
 def test_gen_update_delivery_options_changeset():
     response = gen_update_delivery_options_changeset(
-        '123',
-        'Chart 1.2.3',
-        'Release Notes...',
-        'Chart - 1.2.3',
-        ['EKS'],
-        ['123.dkr.ecr.us-east-1.amazonaws.com/sellername/reponame1:1'],
-        '123.dkr.ecr.us-east-1.amazonaws.com/sellername/reponame1:helmchart1',
-        'Helm chart description',
-        'Usage instructions',
-        True,
-        'Service account name',
-        'Optional release name',
-        'Optional k8s namespace',
-        [
-            {
-                "Key": "HelmKeyName1",
-                "DefaultValue": "${AWSMP_LICENSE_SECRET}",
-                "Metadata":
-                {
-                    "Label": "AWS CloudFormation template field label",
-                    "Description": "AWS CloudFormation field description",
-                    "Obfuscate": False
-                }
-            }
-        ],
-        '123-321'
+        _HELM_ARGS[0],
+        '123-321',
+        *_HELM_ARGS[1:]
     )
     assert 'Details' in response
     assert response['ChangeType'] == 'UpdateDeliveryOptions'
+    details = json.loads(response['Details'])
+    assert details['DeliveryOptions'][0]['Id'] == '123-321'
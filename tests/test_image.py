@@ -8,6 +8,21 @@ from aws_mp_utils.image import (
     get_images_details
 )
 
+_RESTRICT_DETAILS_JSON = json.dumps({'DeliveryOptionIds': ['987654321']})
+
+
+def _entity(ami_id='ami-123'):
+    return {
+        'DetailsDocument': {
+            'Versions': [
+                {
+                    'Sources': [{'Image': ami_id, 'Id': '1234'}],
+                    'DeliveryOptions': [{'Id': '4321', 'SourceId': '1234'}]
+                }
+            ]
+        }
+    }
+
 
 def test_create_restrict_version_change_doc():
     expected = {
@@ -15,42 +30,16 @@ def test_create_restrict_version_change_doc():
         'Entity': {
             'Type': 'AmiProduct@1.0',
             'Identifier': '123456789'
-        }
-    }
-    details = {
-        'DeliveryOptionIds': ['987654321']
+        },
+        'Details': _RESTRICT_DETAILS_JSON
     }
-    expected['Details'] = json.dumps(details)
 
     actual = create_restrict_version_change_doc('123456789', '987654321')
     assert expected == actual
 
 
-def test_get_image_delivery_option_id():
-    details = {
-        "Versions": [
-            {
-                "Sources": [
-                    {
-                        "Image": "ami-123",
-                        "Id": "1234"
-                    }
-                ],
-                "DeliveryOptions": [
-                    {
-                        "Id": "4321",
-                        "SourceId": "1234"
-                    }
-                ]
-            }
-        ]
-    }
-
-    entity = {
-        'DetailsDocument': details
-    }
-    client = Mock()
-    client.describe_entity.return_value = entity
+def test_get_image_delivery_option_id(fake_client):
+    client = fake_client(describe_entity=_entity())
 
     did = get_image_delivery_option_id(
         client,
@@ -60,8 +49,7 @@ def test_get_image_delivery_option_id():
     assert did == '4321'
 
     # Test no image match found
-    details['Versions'][0]['Sources'][0]['Image'] = 'ami-321'
-    entity['Details'] = json.dumps(details)
+    client = fake_client(describe_entity=_entity('ami-321'))
 
     did = get_image_delivery_option_id(
         client,
@@ -71,6 +59,27 @@ def test_get_image_delivery_option_id():
     assert did is None
 
 
+def test_get_image_delivery_option_id_multiple_sources(fake_client):
+    details = {
+        "Versions": [
+            {
+                "Sources": [
+                    {"Image": "ami-111", "Id": "1111"},
+                    {"Image": "ami-222", "Id": "2222"}
+                ],
+                "DeliveryOptions": [
+                    {"Id": "4444", "SourceId": "1111"},
+                    {"Id": "5555", "SourceId": "2222"}
+                ]
+            }
+        ]
+    }
+    client = fake_client(describe_entity={'DetailsDocument': details})
+
+    did = get_image_delivery_option_id(client, '1234589', 'ami-222')
+    assert did == '5555'
+
+
 def test_get_images_details():
     expected_images = [
         {
@@ -87,7 +96,7 @@ def test_get_images_details():
     describe_images_response = {
         'Images': expected_images
     }
-    client = Mock()
+    client = Mock(spec_set=['describe_images'])
     client.describe_images.return_value = describe_images_response
     ami_ids = ['ami-12345', 'ami-67890']
     images = get_images_details(client=client, ami_ids=ami_ids)
@@ -0,0 +1,13 @@
+import importlib
+
+from unittest.mock import patch
+
+
+def test_import_changeset_loads_no_service_model():
+    """Keep service model loading out of the change set tests import."""
+    module = importlib.import_module('test_changeset')
+
+    with patch('botocore.loaders.Loader.load_service_model') as mock_load:
+        importlib.reload(module)
+
+    mock_load.assert_not_called()
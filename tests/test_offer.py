@@ -1,7 +1,5 @@
 import json
 
-from unittest.mock import Mock
-
 from aws_mp_utils.offer import (
     create_update_offer_change_doc,
     get_ami_ids_in_mp_entity,
@@ -37,7 +35,7 @@ def test_create_update_offer_change_doc():
     assert expected == actual
 
 
-def test_get_ami_ids_in_mp_entity():
+def test_get_ami_ids_in_mp_entity(fake_client):
     details = {
         "Versions": [
             {
@@ -92,8 +90,7 @@ def test_get_ami_ids_in_mp_entity():
     entity = {
         'DetailsDocument': details
     }
-    client = Mock()
-    client.describe_entity.return_value = entity
+    client = fake_client(describe_entity=entity)
 
     ami_ids = get_ami_ids_in_mp_entity(
         client,
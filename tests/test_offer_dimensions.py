@@ -1,5 +1,3 @@
-from unittest.mock import Mock
-
 from aws_mp_utils.offer_dimensions import (
     get_available_dimensions,
     create_restrict_dimensions_change_doc,
@@ -7,7 +5,7 @@ from aws_mp_utils.offer_dimensions import (
 )
 
 
-def test_get_available_dimensions():
+def test_get_available_dimensions(fake_client):
     details = {
         "Dimensions": [
             {
@@ -30,8 +28,7 @@ def test_get_available_dimensions():
     entity = {
         'DetailsDocument': details
     }
-    client = Mock()
-    client.describe_entity.return_value = entity
+    client = fake_client(describe_entity=entity)
 
     dimensions = get_available_dimensions(client, '1234589')
     assert len(dimensions) == 2
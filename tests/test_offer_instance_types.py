@@ -1,5 +1,3 @@
-from unittest.mock import Mock
-
 from aws_mp_utils.offer_instance_types import (
     get_available_instance_types,
     create_restrict_instance_types_change_doc,
@@ -7,7 +5,7 @@ from aws_mp_utils.offer_instance_types import (
 )
 
 
-def test_get_available_instance_types():
+def test_get_available_instance_types(fake_client):
     details = {
         "Versions": [
             {
@@ -29,8 +27,7 @@ def test_get_available_instance_types():
     entity = {
         'DetailsDocument': details
     }
-    client = Mock()
-    client.describe_entity.return_value = entity
+    client = fake_client(describe_entity=entity)
 
     instance_types = get_available_instance_types(client, '1234589')
     assert len(instance_types) == 2